@@ -18,40 +18,61 @@ from tkinter import ttk, messagebox
 import math
 import ast
 import re
-from typing import Optional, Dict, List, Tuple
+import functools
+from functools import partial
+from typing import Optional, Dict, List, Tuple, Deque
+from collections import deque
+from itertools import islice
 from datetime import datetime
 import json
 import os
+import sys
+from types import MappingProxyType
+
+
+ALLOWED_NAMES = MappingProxyType({
+    **{name: getattr(math, name) for name in dir(math) if not name.startswith("__")},
+    'abs': abs,
+    'round': round,
+    'pow': pow,
+    'factorial': math.factorial,
+    'min': min,
+    'max': max
+})
+
+# eval() requires a real dict for globals; names resolve there directly
+ALLOWED_GLOBALS = {'__builtins__': {}, **ALLOWED_NAMES}
+
+ALLOWED_NODES = (
+    ast.Expression, ast.Call, ast.Name, ast.Load, ast.BinOp, ast.UnaryOp,
+    ast.Num, ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
+    ast.Pow, ast.USub, ast.UAdd, ast.LShift, ast.RShift, ast.BitXor,
+    ast.BitAnd, ast.BitOr, ast.FloorDiv, ast.Tuple, ast.List
+)
+_ALLOWED_TYPES = frozenset(ALLOWED_NODES)
+
+_TRANS = str.maketrans({'×': '*', '÷': '/'})
+_SUB = re.compile('[π^]')
+_SUB_MAP = {'π': 'pi', '^': '**'}
+
+
+def _rep(match: re.Match) -> str:
+    """Map a matched symbol to its Python spelling"""
+    return _SUB_MAP[match.group()]
 
 
 class SafeEvaluator:
     """Secure mathematical expression evaluator"""
 
-    ALLOWED_NAMES = {name: getattr(math, name) for name in dir(math) if not name.startswith("__")}
-    ALLOWED_NAMES.update({
-        'abs': abs,
-        'round': round,
-        'pow': pow,
-        'factorial': math.factorial,
-        'min': min,
-        'max': max
-    })
-
-    ALLOWED_NODES = (
-        ast.Expression, ast.Call, ast.Name, ast.Load, ast.BinOp, ast.UnaryOp,
-        ast.Num, ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
-        ast.Pow, ast.USub, ast.UAdd, ast.LShift, ast.RShift, ast.BitXor,
-        ast.BitAnd, ast.BitOr, ast.FloorDiv, ast.Tuple, ast.List
-    )
+    ALLOWED_NAMES = ALLOWED_NAMES
+    ALLOWED_GLOBALS = ALLOWED_GLOBALS
+    ALLOWED_NODES = ALLOWED_NODES
 
     @classmethod
-    def evaluate(cls, expr: str) -> float:
-        """Safely evaluate mathematical expression"""
-        if not expr or not expr.strip():
-            raise ValueError("Empty expression")
-
-        expr = expr.strip()
-        expr = expr.replace('×', '*').replace('÷', '/').replace('^', '**').replace('π', 'pi')
+    @functools.lru_cache(maxsize=256)
+    def _compile(cls, expr: str):
+        """Parse, validate and compile a normalized expression (cached)"""
+        expr = _SUB.sub(_rep, expr.translate(_TRANS))
 
         try:
             node = ast.parse(expr, mode='eval')
@@ -59,13 +80,22 @@ class SafeEvaluator:
             raise ValueError(f"Syntax error: {str(e)}")
 
         for n in ast.walk(node):
-            if not isinstance(n, cls.ALLOWED_NODES):
-                raise ValueError(f"Unsupported operation: {type(n).__name__}")
-            if isinstance(n, ast.Name) and n.id not in cls.ALLOWED_NAMES:
+            t = type(n)
+            if t not in _ALLOWED_TYPES:
+                raise ValueError(f"Unsupported operation: {t.__name__}")
+            if t is ast.Name and n.id not in cls.ALLOWED_NAMES:
                 raise ValueError(f"Unknown function or constant: {n.id}")
 
-        compiled = compile(node, '<safe>', 'eval')
-        result = eval(compiled, {'__builtins__': {}}, cls.ALLOWED_NAMES)
+        return compile(node, '<safe>', 'eval')
+
+    @classmethod
+    def evaluate(cls, expr: str) -> float:
+        """Safely evaluate mathematical expression"""
+        if not expr or not expr.strip():
+            raise ValueError("Empty expression")
+
+        code = cls._compile(expr.strip())
+        result = eval(code, cls.ALLOWED_GLOBALS)
 
         if isinstance(result, complex):
             if result.imag == 0:
@@ -80,8 +110,9 @@ class HistoryManager:
 
     def __init__(self, filename: str = "calc_history.json"):
         self.filename = os.path.join(os.path.expanduser("~"), ".calculator", filename)
-        self.history: List[Dict] = []
         self.max_history = 100
+        self.history: Deque[Dict] = deque(maxlen=self.max_history)
+        self._dirty = False
         self._ensure_dir()
         self.load()
 
@@ -96,27 +127,29 @@ class HistoryManager:
             'result': result,
             'timestamp': datetime.now().isoformat()
         }
-        self.history.insert(0, entry)
-
-        if len(self.history) > self.max_history:
-            self.history = self.history[:self.max_history]
-
-        self.save()
+        self.history.appendleft(entry)
+        self._dirty = True
 
     def get_recent(self, limit: int = 20) -> List[Dict]:
         """Get recent calculations"""
-        return self.history[:limit]
+        return list(islice(self.history, limit))
 
     def clear(self):
         """Clear all history"""
-        self.history = []
+        self.history.clear()
         self.save()
 
+    def flush(self):
+        """Save history if it changed since last save"""
+        if self._dirty:
+            self.save()
+
     def save(self):
         """Save history to file"""
         try:
             with open(self.filename, 'w') as f:
-                json.dump(self.history, f, indent=2)
+                json.dump(list(self.history), f)
+            self._dirty = False
         except Exception:
             pass
 
@@ -125,9 +158,9 @@ class HistoryManager:
         try:
             if os.path.exists(self.filename):
                 with open(self.filename, 'r') as f:
-                    self.history = json.load(f)
+                    self.history = deque(json.load(f)[:self.max_history], maxlen=self.max_history)
         except Exception:
-            self.history = []
+            self.history = deque(maxlen=self.max_history)
 
 
 class NumberConverter:
@@ -140,25 +173,21 @@ class NumberConverter:
         'Hexadecimal': 16
     }
 
-    @staticmethod
-    def validate_input(value: str, base_name: str) -> bool:
+    _VALIDATORS = {
+        'Binary': re.compile(r'^[01]+$').match,
+        'Octal': re.compile(r'^[0-7]+$').match,
+        'Decimal': re.compile(r'^-?\d+$').match,
+        'Hexadecimal': re.compile(r'^[0-9A-Fa-f]+$').match
+    }
+
+    @classmethod
+    def validate_input(cls, value: str, base_name: str) -> bool:
         """Validate input for given base"""
         value = value.strip().replace(' ', '')
         if not value:
             return False
 
-        base = NumberConverter.BASES[base_name]
-
-        if base_name == 'Binary':
-            return bool(re.match(r'^[01]+$', value))
-        elif base_name == 'Octal':
-            return bool(re.match(r'^[0-7]+$', value))
-        elif base_name == 'Decimal':
-            return bool(re.match(r'^-?\d+$', value))
-        elif base_name == 'Hexadecimal':
-            return bool(re.match(r'^[0-9A-Fa-f]+$', value))
-
-        return False
+        return bool(cls._VALIDATORS[base_name](value))
 
     @staticmethod
     def convert(value: str, from_base: str, to_base: str) -> str:
@@ -181,6 +210,34 @@ class NumberConverter:
 
         return ""
 
+    @staticmethod
+    def _allow_int_digits(digits: int):
+        """Raise the interpreter's int/str digit limit for very large inputs"""
+        if not hasattr(sys, 'get_int_max_str_digits'):
+            return
+        limit = sys.get_int_max_str_digits()
+        if limit and digits > limit:
+            sys.set_int_max_str_digits(digits)
+
+    @classmethod
+    def to_all_bases(cls, value: str, from_base: str) -> Dict[str, str]:
+        """Convert number to every supported base in one pass"""
+        value = value.strip().replace(' ', '')
+
+        if not cls.validate_input(value, from_base):
+            raise ValueError(f"Invalid {from_base} number")
+
+        cls._allow_int_digits(len(value) * 4)
+        decimal_value = int(value, cls.BASES[from_base])
+        sign, magnitude = ('-', -decimal_value) if decimal_value < 0 else ('', decimal_value)
+
+        return {
+            'Binary': sign + format(magnitude, 'b'),
+            'Octal': sign + format(magnitude, 'o'),
+            'Decimal': str(decimal_value),
+            'Hexadecimal': sign + format(magnitude, 'X')
+        }
+
 
 class Theme:
     """Theme configuration"""
@@ -222,108 +279,82 @@ class Theme:
     }
 
 
-class ModernButton(tk.Canvas):
-    """Custom modern button with hover effects"""
-
-    def __init__(self, parent, text: str, command, width: int = 60, height: int = 50,
-                 style: str = 'default', **kwargs):
-        super().__init__(parent, width=width, height=height,
-                        highlightthickness=0, **kwargs)
-
-        self.text = text
-        self.command = command
-        self.style = style
-        self.hover = False
-
-        self.bind('<Button-1>', self._on_click)
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
-
-        self.draw()
-
-    def draw(self):
-        """Draw button"""
-        self.delete('all')
-
-        app = self.master
-        while not isinstance(app, CalculatorApp):
-            app = app.master
-
-        theme = Theme.DARK if app.dark_mode.get() else Theme.LIGHT
-
-        if self.style == 'operator':
-            bg = theme['accent']
-            fg = '#ffffff'
-            if self.hover:
-                bg = theme['accent_hover']
-        elif self.style == 'equals':
-            bg = theme['success']
-            fg = '#ffffff'
-            if self.hover:
-                bg = theme['success']
-        elif self.style == 'clear':
-            bg = theme['error']
-            fg = '#ffffff'
-            if self.hover:
-                bg = theme['error']
-        else:
-            bg = theme['btn_hover'] if self.hover else theme['btn_bg']
-            fg = theme['fg']
-
-        w, h = self.winfo_width(), self.winfo_height()
-        if w <= 1:
-            w, h = int(self['width']), int(self['height'])
-
-        radius = 8
-        self.create_rounded_rect(2, 2, w-2, h-2, radius, fill=bg, outline='')
-
-        font_size = 11 if len(self.text) > 4 else 13
-        self.create_text(w/2, h/2, text=self.text, fill=fg,
-                        font=('Segoe UI', font_size, 'bold'))
-
-    def create_rounded_rect(self, x1, y1, x2, y2, radius, **kwargs):
-        """Create rounded rectangle"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
-
-    def _on_click(self, event):
-        """Handle click"""
-        if self.command:
-            self.command()
-
-    def _on_enter(self, event):
-        """Handle mouse enter"""
-        self.hover = True
-        self.draw()
-
-    def _on_leave(self, event):
-        """Handle mouse leave"""
-        self.hover = False
-        self.draw()
+def _widget_config(theme: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+    """Build configure() options for each registered widget kind"""
+    toggle = {'bg': theme['bg'], 'fg': theme['fg'],
+              'selectcolor': theme['panel'], 'activebackground': theme['bg']}
+    return {
+        'root': {'bg': theme['bg']},
+        'frame': {'bg': theme['bg']},
+        'labelframe': {'bg': theme['panel'], 'fg': theme['fg']},
+        'label': {'bg': theme['panel'], 'fg': theme['fg']},
+        'entry_rw': {'bg': theme['display_bg'], 'fg': theme['fg'],
+                     'insertbackground': theme['fg']},
+        'entry_ro': {'bg': theme['display_bg'], 'fg': theme['secondary_fg'],
+                     'readonlybackground': theme['display_bg']},
+        'text': {'bg': theme['history_bg'], 'fg': theme['fg'],
+                 'insertbackground': theme['fg']},
+        'button': {'bg': theme['btn_bg'], 'fg': theme['fg'],
+                   'activebackground': theme['btn_hover']},
+        'radio': toggle,
+        'check': toggle
+    }
+
+
+_CFG = {'light': _widget_config(Theme.LIGHT), 'dark': _widget_config(Theme.DARK)}
+
+
+_BUTTON_GRID = (
+    (('MC', 'default'), ('MR', 'default'), ('M+', 'default'), ('M-', 'default'), ('C', 'clear')),
+    (('sin', 'default'), ('cos', 'default'), ('tan', 'default'), ('(', 'default'), (')', 'default')),
+    (('√', 'default'), ('x²', 'default'), ('xʸ', 'default'), ('÷', 'operator'), ('⌫', 'default')),
+    (('7', 'default'), ('8', 'default'), ('9', 'default'), ('×', 'operator'), ('ln', 'default')),
+    (('4', 'default'), ('5', 'default'), ('6', 'default'), ('-', 'operator'), ('log', 'default')),
+    (('1', 'default'), ('2', 'default'), ('3', 'default'), ('+', 'operator'), ('n!', 'default')),
+    (('±', 'default'), ('0', 'default'), ('.', 'default'), ('=', 'equals'), ('Ans', 'default'))
+)
+
+_STYLE_MAP = {
+    'default': 'Default.TButton',
+    'operator': 'Operator.TButton',
+    'equals': 'Equals.TButton',
+    'clear': 'Clear.TButton'
+}
 
 
 class CalculatorFrame(tk.Frame):
     """Scientific calculator with history"""
 
+    HISTORY_LIMIT = 20
+
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
         self.history_manager = HistoryManager()
         self.memory = 0.0
         self.last_answer = 0.0
+        self._flush_after = None
+
+        self._actions = {
+            'C': self.clear,
+            '⌫': self.backspace,
+            '=': self.evaluate,
+            'Ans': self._paste_ans,
+            '√': partial(self._insert, 'sqrt('),
+            'x²': partial(self._insert, '**2'),
+            'xʸ': partial(self._insert, '**'),
+            'sin': partial(self._insert, 'sin('),
+            'cos': partial(self._insert, 'cos('),
+            'tan': partial(self._insert, 'tan('),
+            'ln': partial(self._insert, 'log('),
+            'log': partial(self._insert, 'log10('),
+            'n!': partial(self._insert, 'factorial('),
+            '±': self._toggle_sign,
+            'MC': self._memory_clear,
+            'MR': self._memory_recall,
+            'M+': self._memory_add,
+            'M-': self._memory_subtract
+        }
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=2)
@@ -335,75 +366,71 @@ class CalculatorFrame(tk.Frame):
 
     def _create_calculator_panel(self):
         """Create main calculator interface"""
-        calc_panel = tk.Frame(self)
+        register = self.controller._register
+
+        calc_panel = register(tk.Frame(self), 'frame')
         calc_panel.grid(row=0, column=0, sticky='nsew', padx=(0, 4))
         calc_panel.grid_rowconfigure(1, weight=1)
         calc_panel.grid_columnconfigure(0, weight=1)
 
-        display_frame = tk.Frame(calc_panel)
+        display_frame = register(tk.Frame(calc_panel), 'frame')
         display_frame.grid(row=0, column=0, sticky='ew', padx=8, pady=8)
         display_frame.grid_columnconfigure(0, weight=1)
 
-        memory_frame = tk.Frame(display_frame)
+        memory_frame = register(tk.Frame(display_frame), 'frame')
         memory_frame.grid(row=0, column=0, sticky='ew', pady=(0, 4))
 
-        self.memory_label = tk.Label(memory_frame, text='', font=('Consolas', 9), anchor='w')
+        self.memory_label = register(tk.Label(memory_frame, text='', font=('Consolas', 9), anchor='w'),
+                                     'label')
         self.memory_label.pack(side='left')
 
         self.expression_var = tk.StringVar()
-        expression_entry = tk.Entry(display_frame, textvariable=self.expression_var,
-                                    font=('Consolas', 14), justify='right',
-                                    relief='flat', bd=8)
+        expression_entry = register(tk.Entry(display_frame, textvariable=self.expression_var,
+                                             font=('Consolas', 14), justify='right',
+                                             relief='flat', bd=8), 'entry_rw')
         expression_entry.grid(row=1, column=0, sticky='ew', ipady=4)
         expression_entry.bind('<Return>', lambda e: self.evaluate())
         expression_entry.bind('<Escape>', lambda e: self.clear())
 
         self.result_var = tk.StringVar(value='0')
-        result_label = tk.Label(display_frame, textvariable=self.result_var,
-                               font=('Consolas', 24, 'bold'), anchor='e')
+        result_label = register(tk.Label(display_frame, textvariable=self.result_var,
+                                         font=('Consolas', 24, 'bold'), anchor='e'), 'label')
         result_label.grid(row=2, column=0, sticky='ew', pady=(4, 0))
 
-        buttons_frame = tk.Frame(calc_panel)
+        buttons_frame = register(tk.Frame(calc_panel), 'frame')
         buttons_frame.grid(row=1, column=0, sticky='nsew', padx=8, pady=(0, 8))
 
-        for i in range(7):
+        for i in range(len(_BUTTON_GRID)):
             buttons_frame.grid_rowconfigure(i, weight=1)
-        for i in range(5):
+        for i in range(len(_BUTTON_GRID[0])):
             buttons_frame.grid_columnconfigure(i, weight=1)
 
-        buttons = [
-            [('MC', 'default'), ('MR', 'default'), ('M+', 'default'), ('M-', 'default'), ('C', 'clear')],
-            [('sin', 'default'), ('cos', 'default'), ('tan', 'default'), ('(', 'default'), (')', 'default')],
-            [('√', 'default'), ('x²', 'default'), ('xʸ', 'default'), ('÷', 'operator'), ('⌫', 'default')],
-            [('7', 'default'), ('8', 'default'), ('9', 'default'), ('×', 'operator'), ('ln', 'default')],
-            [('4', 'default'), ('5', 'default'), ('6', 'default'), ('-', 'operator'), ('log', 'default')],
-            [('1', 'default'), ('2', 'default'), ('3', 'default'), ('+', 'operator'), ('n!', 'default')],
-            [('±', 'default'), ('0', 'default'), ('.', 'default'), ('=', 'equals'), ('Ans', 'default')]
-        ]
-
-        for r, row in enumerate(buttons):
+        for r, row in enumerate(_BUTTON_GRID):
             for c, (label, style) in enumerate(row):
-                btn = ModernButton(buttons_frame, text=label,
-                                  command=lambda l=label: self._on_button(l),
-                                  style=style)
-                btn.grid(row=r, column=c, padx=2, pady=2, sticky='nsew')
+                ttk.Button(buttons_frame, text=label, style=_STYLE_MAP[style],
+                           command=partial(self._on_button, label)).grid(
+                    row=r, column=c, padx=2, pady=2, sticky='nsew')
 
     def _create_history_panel(self):
         """Create history sidebar"""
-        history_panel = tk.Frame(self)
+        register = self.controller._register
+
+        history_panel = register(tk.Frame(self), 'frame')
         history_panel.grid(row=0, column=1, sticky='nsew', padx=(4, 0))
         history_panel.grid_rowconfigure(1, weight=1)
         history_panel.grid_columnconfigure(0, weight=1)
 
-        header_frame = tk.Frame(history_panel)
+        header_frame = register(tk.Frame(history_panel), 'frame')
         header_frame.grid(row=0, column=0, sticky='ew', padx=8, pady=8)
         header_frame.grid_columnconfigure(0, weight=1)
 
-        tk.Label(header_frame, text='History', font=('Segoe UI', 12, 'bold')).pack(side='left')
-        tk.Button(header_frame, text='Clear', command=self._clear_history,
-                 font=('Segoe UI', 9), relief='flat', cursor='hand2').pack(side='right')
+        register(tk.Label(header_frame, text='History', font=('Segoe UI', 12, 'bold')),
+                 'label').pack(side='left')
+        register(tk.Button(header_frame, text='Clear', command=self._clear_history,
+                           font=('Segoe UI', 9), relief='flat', cursor='hand2'),
+                 'button').pack(side='right')
 
-        history_frame = tk.Frame(history_panel)
+        history_frame = register(tk.Frame(history_panel), 'frame')
         history_frame.grid(row=1, column=0, sticky='nsew', padx=8, pady=(0, 8))
         history_frame.grid_rowconfigure(0, weight=1)
         history_frame.grid_columnconfigure(0, weight=1)
@@ -411,9 +438,9 @@ class CalculatorFrame(tk.Frame):
         scrollbar = ttk.Scrollbar(history_frame)
         scrollbar.grid(row=0, column=1, sticky='ns')
 
-        self.history_text = tk.Text(history_frame, wrap='word', state='disabled',
-                                    font=('Consolas', 10), relief='flat',
-                                    yscrollcommand=scrollbar.set)
+        self.history_text = register(tk.Text(history_frame, wrap='word', state='disabled',
+                                             font=('Consolas', 10), relief='flat',
+                                             yscrollcommand=scrollbar.set), 'text')
         self.history_text.grid(row=0, column=0, sticky='nsew')
         scrollbar.config(command=self.history_text.yview)
 
@@ -427,12 +454,30 @@ class CalculatorFrame(tk.Frame):
         self.history_text.config(state='normal')
         self.history_text.delete(1.0, tk.END)
 
-        for entry in self.history_manager.get_recent():
+        for entry in self.history_manager.get_recent(self.HISTORY_LIMIT):
             self.history_text.insert(tk.END, entry['expression'] + '\n', 'expr')
             self.history_text.insert(tk.END, '= ' + entry['result'] + '\n\n', 'result')
 
         self.history_text.config(state='disabled')
 
+    def _prepend_history_entry(self, expression: str, result: str):
+        """Insert newest entry at top of text widget"""
+        self.history_text.config(state='normal')
+        self.history_text.insert('1.0', '= ' + result + '\n\n', 'result')
+        self.history_text.insert('1.0', expression + '\n', 'expr')
+        self.history_text.delete(f'{self.HISTORY_LIMIT * 3 + 1}.0', tk.END)
+        self.history_text.config(state='disabled')
+
+    def _schedule_history_flush(self):
+        """Coalesce history writes into one save after a short delay"""
+        if self._flush_after is None:
+            self._flush_after = self.after(500, self._flush_history)
+
+    def _flush_history(self):
+        """Write pending history to disk"""
+        self._flush_after = None
+        self.history_manager.flush()
+
     def _clear_history(self):
         """Clear all history"""
         if messagebox.askyesno('Clear History', 'Clear all calculation history?'):
@@ -446,31 +491,11 @@ class CalculatorFrame(tk.Frame):
 
     def _on_button(self, label: str):
         """Handle button press"""
-        actions = {
-            'C': self.clear,
-            '⌫': self.backspace,
-            '=': self.evaluate,
-            'Ans': lambda: self._insert(str(self.last_answer)),
-            '√': lambda: self._insert('sqrt('),
-            'x²': lambda: self._insert('**2'),
-            'xʸ': lambda: self._insert('**'),
-            'sin': lambda: self._insert('sin('),
-            'cos': lambda: self._insert('cos('),
-            'tan': lambda: self._insert('tan('),
-            'ln': lambda: self._insert('log('),
-            'log': lambda: self._insert('log10('),
-            'n!': lambda: self._insert('factorial('),
-            '±': self._toggle_sign,
-            'MC': self._memory_clear,
-            'MR': self._memory_recall,
-            'M+': self._memory_add,
-            'M-': self._memory_subtract
-        }
+        (self._actions.get(label) or partial(self._insert, label))()
 
-        if label in actions:
-            actions[label]()
-        else:
-            self._insert(label)
+    def _paste_ans(self):
+        """Insert last answer"""
+        self._insert(str(self.last_answer))
 
     def _insert(self, text: str):
         """Insert text at cursor"""
@@ -546,7 +571,8 @@ class CalculatorFrame(tk.Frame):
             self.last_answer = result
 
             self.history_manager.add(expr, result_str)
-            self._load_history()
+            self._prepend_history_entry(expr, result_str)
+            self._schedule_history_flush()
 
         except Exception as e:
             self.result_var.set('Error')
@@ -556,9 +582,14 @@ class CalculatorFrame(tk.Frame):
 class ConverterFrame(tk.Frame):
     """Number system converter"""
 
+    DISPLAY_LIMIT = 4096
+
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
+        self._pending_after = None
+        self._status_after = None
+        self._full_results: Dict[str, str] = {}
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -567,46 +598,50 @@ class ConverterFrame(tk.Frame):
 
     def _create_interface(self):
         """Create converter interface"""
-        container = tk.Frame(self)
+        register = self.controller._register
+
+        container = register(tk.Frame(self), 'frame')
         container.grid(row=0, column=0, sticky='nsew', padx=40, pady=40)
         container.grid_columnconfigure(0, weight=1)
 
-        tk.Label(container, text='Number System Converter',
-                font=('Segoe UI', 18, 'bold')).grid(row=0, column=0, pady=(0, 20))
+        register(tk.Label(container, text='Number System Converter',
+                          font=('Segoe UI', 18, 'bold')), 'label').grid(row=0, column=0, pady=(0, 20))
 
-        input_frame = tk.LabelFrame(container, text='Input',
-                                    font=('Segoe UI', 11, 'bold'), padx=20, pady=15)
+        input_frame = register(tk.LabelFrame(container, text='Input',
+                                             font=('Segoe UI', 11, 'bold'), padx=20, pady=15),
+                               'labelframe')
         input_frame.grid(row=1, column=0, sticky='ew', pady=10)
         input_frame.grid_columnconfigure(0, weight=1)
 
         self.input_var = tk.StringVar()
         self.input_var.trace('w', self._on_input_change)
 
-        tk.Entry(input_frame, textvariable=self.input_var,
-                font=('Consolas', 16), justify='center').grid(row=0, column=0,
-                                                               sticky='ew', pady=(0, 10))
+        register(tk.Entry(input_frame, textvariable=self.input_var,
+                          font=('Consolas', 16), justify='center'),
+                 'entry_rw').grid(row=0, column=0, sticky='ew', pady=(0, 10))
 
         self.from_var = tk.StringVar(value='Decimal')
         self.from_var.trace('w', self._on_input_change)
 
-        from_frame = tk.Frame(input_frame)
+        from_frame = register(tk.Frame(input_frame), 'frame')
         from_frame.grid(row=1, column=0, sticky='ew')
         from_frame.grid_columnconfigure(1, weight=1)
 
-        tk.Label(from_frame, text='From:', font=('Segoe UI', 10)).grid(row=0, column=0,
-                                                                        sticky='w', padx=(0, 10))
+        register(tk.Label(from_frame, text='From:', font=('Segoe UI', 10)),
+                 'label').grid(row=0, column=0, sticky='w', padx=(0, 10))
 
         from_menu = ttk.Combobox(from_frame, textvariable=self.from_var,
                                 values=list(NumberConverter.BASES.keys()),
                                 state='readonly', font=('Segoe UI', 11))
         from_menu.grid(row=0, column=1, sticky='ew')
 
-        output_frame = tk.LabelFrame(container, text='Output',
-                                     font=('Segoe UI', 11, 'bold'), padx=20, pady=15)
+        output_frame = register(tk.LabelFrame(container, text='Output',
+                                              font=('Segoe UI', 11, 'bold'), padx=20, pady=15),
+                                'labelframe')
         output_frame.grid(row=2, column=0, sticky='ew', pady=10)
         output_frame.grid_columnconfigure(0, weight=1)
 
-        results_container = tk.Frame(output_frame)
+        results_container = register(tk.Frame(output_frame), 'frame')
         results_container.grid(row=0, column=0, sticky='ew')
         results_container.grid_columnconfigure(1, weight=1)
 
@@ -614,35 +649,42 @@ class ConverterFrame(tk.Frame):
         bases = ['Binary', 'Octal', 'Decimal', 'Hexadecimal']
 
         for i, base in enumerate(bases):
-            tk.Label(results_container, text=f'{base}:',
-                    font=('Segoe UI', 10, 'bold'), width=12,
-                    anchor='w').grid(row=i, column=0, sticky='w', pady=5)
+            register(tk.Label(results_container, text=f'{base}:',
+                              font=('Segoe UI', 10, 'bold'), width=12,
+                              anchor='w'), 'label').grid(row=i, column=0, sticky='w', pady=5)
 
             var = tk.StringVar(value='0')
             self.result_vars[base] = var
 
-            result_entry = tk.Entry(results_container, textvariable=var,
-                                   font=('Consolas', 12), state='readonly',
-                                   justify='left', relief='flat')
+            result_entry = register(tk.Entry(results_container, textvariable=var,
+                                             font=('Consolas', 12), state='readonly',
+                                             justify='left', relief='flat'), 'entry_ro')
             result_entry.grid(row=i, column=1, sticky='ew', pady=5)
 
-        btn_frame = tk.Frame(container)
+        btn_frame = register(tk.Frame(container), 'frame')
         btn_frame.grid(row=3, column=0, pady=(20, 0))
 
-        tk.Button(btn_frame, text='Clear', command=self._clear,
-                 font=('Segoe UI', 11), width=15, height=2,
-                 cursor='hand2').pack(side='left', padx=5)
+        register(tk.Button(btn_frame, text='Clear', command=self._clear,
+                           font=('Segoe UI', 11), width=15, height=2,
+                           cursor='hand2'), 'button').pack(side='left', padx=5)
 
-        tk.Button(btn_frame, text='Copy All', command=self._copy_all,
-                 font=('Segoe UI', 11), width=15, height=2,
-                 cursor='hand2').pack(side='left', padx=5)
+        register(tk.Button(btn_frame, text='Copy All', command=self._copy_all,
+                           font=('Segoe UI', 11), width=15, height=2,
+                           cursor='hand2'), 'button').pack(side='left', padx=5)
+
+        self.status_label = register(tk.Label(container, text='', font=('Segoe UI', 10)), 'label')
+        self.status_label.grid(row=4, column=0, pady=(10, 0))
 
     def _on_input_change(self, *args):
-        """Handle input change"""
-        self._convert()
+        """Handle input change (debounced so bursts convert once)"""
+        if self._pending_after:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(30, self._convert)
 
     def _convert(self):
         """Convert number to all bases"""
+        self._pending_after = None
+        self._full_results.clear()
         input_val = self.input_var.get().strip()
         from_base = self.from_var.get()
 
@@ -651,40 +693,67 @@ class ConverterFrame(tk.Frame):
                 var.set('0')
             return
 
-        if not NumberConverter.validate_input(input_val, from_base):
+        try:
+            results = NumberConverter.to_all_bases(input_val, from_base)
+        except ValueError:
             for var in self.result_vars.values():
                 var.set('Invalid input')
             return
-
-        try:
-            for to_base, var in self.result_vars.items():
-                result = NumberConverter.convert(input_val, from_base, to_base)
-                var.set(result)
         except Exception as e:
             for var in self.result_vars.values():
                 var.set(f'Error: {str(e)}')
+            return
+
+        for to_base, result in results.items():
+            if len(result) > self.DISPLAY_LIMIT:
+                self._full_results[to_base] = result
+                result = result[:self.DISPLAY_LIMIT] + '… (truncated)'
+            self.result_vars[to_base].set(result)
 
     def _clear(self):
         """Clear all fields"""
         self.input_var.set('')
+        self._full_results.clear()
         for var in self.result_vars.values():
             var.set('0')
 
     def _copy_all(self):
         """Copy all results to clipboard"""
-        results = []
-        for base, var in self.result_vars.items():
-            results.append(f'{base}: {var.get()}')
-
-        text = '\n'.join(results)
+        full = self._full_results
+        text = '\n'.join(f'{base}: {full.get(base) or var.get()}'
+                         for base, var in self.result_vars.items())
         self.clipboard_clear()
         self.clipboard_append(text)
-        messagebox.showinfo('Copied', 'All results copied to clipboard')
+        self._show_status('All results copied to clipboard')
+
+    def _show_status(self, message: str):
+        """Show a transient status message without blocking the event loop"""
+        if self._status_after:
+            self.after_cancel(self._status_after)
+        self.status_label.config(text=message)
+        self._status_after = self.after(1500, self._hide_status)
+
+    def _hide_status(self):
+        """Hide status message"""
+        self._status_after = None
+        self.status_label.config(text='')
 
 
 class CalculatorApp(tk.Tk):
     """Main application window"""
 
+    THEMED_KINDS = ('frame', 'labelframe', 'label', 'entry_rw', 'entry_ro', 'text',
+                    'button', 'radio', 'check')
+
+    # ttk button style -> (background, foreground, hover background) theme keys;
+    # a foreground of None means white text on an accent colour
+    BUTTON_STYLES = {
+        'Default.TButton': ('btn_bg', 'fg', 'btn_hover'),
+        'Operator.TButton': ('accent', None, 'accent_hover'),
+        'Equals.TButton': ('success', None, 'success'),
+        'Clear.TButton': ('error', None, 'error')
+    }
+
     def __init__(self):
         super().__init__()
 
@@ -694,6 +763,12 @@ class CalculatorApp(tk.Tk):
 
         self.dark_mode = tk.BooleanVar(value=False)
         self.current_frame = None
+        self.style = ttk.Style(self)
+        self.style.theme_use('clam')
+        for name in self.BUTTON_STYLES:
+            self.style.configure(name, font=('Segoe UI', 13, 'bold'), borderwidth=0,
+                                 focusthickness=0, padding=(4, 10))
+        self._themed: Dict[str, List[tk.Widget]] = {kind: [] for kind in self.THEMED_KINDS}
 
         self._create_ui()
         self._apply_theme()
@@ -705,101 +780,96 @@ class CalculatorApp(tk.Tk):
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        toolbar = tk.Frame(self, height=50)
+        register = self._register
+
+        toolbar = register(tk.Frame(self, height=50), 'frame')
         toolbar.grid(row=0, column=0, sticky='ew')
         toolbar.grid_columnconfigure(1, weight=1)
 
-        mode_frame = tk.Frame(toolbar)
+        mode_frame = register(tk.Frame(toolbar), 'frame')
         mode_frame.grid(row=0, column=0, padx=15, pady=10)
 
         self.mode_var = tk.StringVar(value='calculator')
 
-        tk.Radiobutton(mode_frame, text='Scientific Calculator',
-                      variable=self.mode_var, value='calculator',
-                      command=self._switch_mode, font=('Segoe UI', 10),
-                      cursor='hand2').pack(side='left', padx=5)
+        register(tk.Radiobutton(mode_frame, text='Scientific Calculator',
+                                variable=self.mode_var, value='calculator',
+                                command=self._switch_mode, font=('Segoe UI', 10),
+                                cursor='hand2'), 'radio').pack(side='left', padx=5)
 
-        tk.Radiobutton(mode_frame, text='Number Converter',
-                      variable=self.mode_var, value='converter',
-                      command=self._switch_mode, font=('Segoe UI', 10),
-                      cursor='hand2').pack(side='left', padx=5)
+        register(tk.Radiobutton(mode_frame, text='Number Converter',
+                                variable=self.mode_var, value='converter',
+                                command=self._switch_mode, font=('Segoe UI', 10),
+                                cursor='hand2'), 'radio').pack(side='left', padx=5)
 
-        theme_frame = tk.Frame(toolbar)
+        theme_frame = register(tk.Frame(toolbar), 'frame')
         theme_frame.grid(row=0, column=2, padx=15, pady=10)
 
-        tk.Checkbutton(theme_frame, text='🌙 Dark Mode',
-                      variable=self.dark_mode, command=self._apply_theme,
-                      font=('Segoe UI', 10), cursor='hand2').pack()
+        register(tk.Checkbutton(theme_frame, text='🌙 Dark Mode',
+                                variable=self.dark_mode, command=self._apply_theme,
+                                font=('Segoe UI', 10), cursor='hand2'), 'check').pack()
 
-        self.container = tk.Frame(self)
+        self.container = register(tk.Frame(self), 'frame')
         self.container.grid(row=1, column=0, sticky='nsew')
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
 
         self.frames = {}
-        for F in (CalculatorFrame, ConverterFrame):
-            frame = F(self.container, self)
-            frame.grid(row=0, column=0, sticky='nsew')
-            self.frames[F.__name__] = frame
+        self._frame_classes = {'CalculatorFrame': CalculatorFrame, 'ConverterFrame': ConverterFrame}
 
         self._switch_mode()
 
     def _switch_mode(self):
         """Switch between calculator and converter"""
         frame_name = 'CalculatorFrame' if self.mode_var.get() == 'calculator' else 'ConverterFrame'
+        if frame_name not in self.frames:
+            self._create_frame(frame_name)
         self.current_frame = self.frames[frame_name]
         self.current_frame.tkraise()
 
-    def _apply_theme(self):
-        """Apply current theme"""
-        theme = Theme.DARK if self.dark_mode.get() else Theme.LIGHT
+    def _register(self, widget: tk.Widget, kind: str) -> tk.Widget:
+        """Register widget for theming and return it"""
+        self._themed[kind].append(widget)
+        return widget
 
-        def style_widget(widget, is_button=False):
-            """Recursively style widget and children"""
-            try:
-                widget_class = widget.__class__.__name__
-
-                if isinstance(widget, ModernButton):
-                    widget.draw()
-                elif widget_class in ('Frame', 'LabelFrame', 'Tk'):
-                    widget.configure(bg=theme['panel'] if widget_class == 'LabelFrame' else theme['bg'])
-                    if widget_class == 'LabelFrame':
-                        widget.configure(fg=theme['fg'])
-                elif widget_class == 'Label':
-                    widget.configure(bg=theme['panel'], fg=theme['fg'])
-                elif widget_class == 'Entry':
-                    state = widget.cget('state')
-                    if state == 'readonly':
-                        widget.configure(bg=theme['display_bg'], fg=theme['secondary_fg'],
-                                       readonlybackground=theme['display_bg'])
-                    else:
-                        widget.configure(bg=theme['display_bg'], fg=theme['fg'],
-                                       insertbackground=theme['fg'])
-                elif widget_class == 'Text':
-                    widget.configure(bg=theme['history_bg'], fg=theme['fg'],
-                                   insertbackground=theme['fg'])
-                elif widget_class == 'Button':
-                    widget.configure(bg=theme['btn_bg'], fg=theme['fg'],
-                                   activebackground=theme['btn_hover'])
-                elif widget_class == 'Radiobutton':
-                    widget.configure(bg=theme['bg'], fg=theme['fg'],
-                                   selectcolor=theme['panel'],
-                                   activebackground=theme['bg'])
-                elif widget_class == 'Checkbutton':
-                    widget.configure(bg=theme['bg'], fg=theme['fg'],
-                                   selectcolor=theme['panel'],
-                                   activebackground=theme['bg'])
-            except:
-                pass
+    def _create_frame(self, frame_name: str):
+        """Build a mode frame on first use and theme only its widgets"""
+        start = {kind: len(widgets) for kind, widgets in self._themed.items()}
 
-            for child in widget.winfo_children():
-                style_widget(child)
+        frame = self._frame_classes[frame_name](self.container, self)
+        frame.grid(row=0, column=0, sticky='nsew')
+        self.frames[frame_name] = frame
 
-        self.configure(bg=theme['bg'])
-        style_widget(self)
+        cfg = _CFG['dark' if self.dark_mode.get() else 'light']
+        self._style_widgets({kind: widgets[start[kind]:] for kind, widgets in self._themed.items()},
+                            cfg)
+
+    def _apply_theme(self):
+        """Apply current theme"""
+        dark = self.dark_mode.get()
+        theme = Theme.DARK if dark else Theme.LIGHT
+        cfg = _CFG['dark' if dark else 'light']
+
+        self.configure(**cfg['root'])
+        self._style_widgets(self._themed, cfg)
+
+        for name, (bg_key, fg_key, hover_key) in self.BUTTON_STYLES.items():
+            fg = theme[fg_key] if fg_key else '#ffffff'
+            self.style.configure(name, background=theme[bg_key], foreground=fg)
+            self.style.map(name, background=[('active', theme[hover_key])],
+                           foreground=[('active', fg)])
+
+    def _style_widgets(self, themed: Dict[str, List[tk.Widget]], cfg: Dict[str, Dict[str, str]]):
+        """Configure registered widgets with precomputed theme options"""
+        for kind, widgets in themed.items():
+            options = cfg[kind]
+            for w in widgets:
+                w.configure(**options)
 
     def _on_close(self):
         """Handle window close"""
+        calculator = self.frames.get('CalculatorFrame')
+        if calculator:
+            calculator.history_manager.flush()
         self.destroy()
 
 
@@ -12,44 +12,150 @@ Run: python advanced_tk_calculator.py
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import math
 import ast
+import functools
+from typing import NamedTuple
 
 # ---------------- safe evaluator -----------------
-ALLOWED_NAMES = {name: getattr(math, name) for name in dir(math) if not name.startswith("__")}
+_FACT_LUT = tuple(map(math.factorial, range(65)))
+
+def fast_factorial(n):
+    if type(n) is int and 0 <= n < 65:
+        return _FACT_LUT[n]
+    return math.factorial(n)
+
+# exact values at common multiples of pi; keys match what e.g. 'pi/6' or '3*pi/4' evaluate to
+_pi, _r2, _r3 = math.pi, math.sqrt(2)/2, math.sqrt(3)/2
+_SIN_LUT = {0.0:0.0, _pi/6:0.5, _pi/4:_r2, _pi/3:_r3, _pi/2:1.0, 2*_pi/3:_r3, 3*_pi/4:_r2,
+            5*_pi/6:0.5, _pi:0.0, 3*_pi/2:-1.0, 2*_pi:0.0}
+_COS_LUT = {0.0:1.0, _pi/6:_r3, _pi/4:_r2, _pi/3:0.5, _pi/2:0.0, 2*_pi/3:-0.5, 3*_pi/4:-_r2,
+            5*_pi/6:-_r3, _pi:-1.0, 3*_pi/2:0.0, 2*_pi:1.0}
+_TAN_LUT = {0.0:0.0, _pi/6:math.sqrt(3)/3, _pi/4:1.0, _pi/3:math.sqrt(3), 3*_pi/4:-1.0, _pi:0.0}
+
+def _with_lut(fn, lut):
+    @functools.wraps(fn)
+    def lookup(x):
+        r = lut.get(x)
+        return fn(x) if r is None else r
+    return lookup
+
+MATH_NAMES = (
+    'pi', 'e', 'tau', 'sqrt', 'exp', 'log', 'log10', 'log2',
+    'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'sinh', 'cosh', 'tanh',
+    'degrees', 'radians', 'floor', 'ceil'
+)
+ALLOWED_NAMES = {name: getattr(math, name) for name in MATH_NAMES}
 ALLOWED_NAMES.update({
+    'sin': _with_lut(math.sin, _SIN_LUT),
+    'cos': _with_lut(math.cos, _COS_LUT),
+    'tan': _with_lut(math.tan, _TAN_LUT),
     'abs': abs,
     'round': round,
     'pow': pow,
-    'factorial': math.factorial
+    'factorial': fast_factorial
 })
+EVAL_GLOBALS = {'__builtins__': {}, **ALLOWED_NAMES}
+_EXPR_TRANS = str.maketrans({'×':'*','÷':'/'})
 
-ALLOWED_NODES = (
+ALLOWED_NODE_TYPES = frozenset({
     ast.Expression, ast.Call, ast.Name, ast.Load, ast.BinOp, ast.UnaryOp,
-    ast.Num, ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
+    ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
     ast.Pow, ast.USub, ast.UAdd, ast.LShift, ast.RShift, ast.BitXor,
     ast.BitAnd, ast.BitOr, ast.FloorDiv, ast.Tuple, ast.List, ast.Subscript,
-    ast.Index, ast.Slice
-)
+    ast.Slice
+})
 
-def safe_eval(expr: str):
-    expr = expr.replace('×', '*').replace('÷', '/').replace('^', '**')
+def _validate(node):
+    # iterative on purpose: a recursive visitor hits RecursionError on long flat sums
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        t = type(n)
+        if t not in ALLOWED_NODE_TYPES:
+            raise ValueError(f"Disallowed expression: {t.__name__}")
+        if t is ast.Name:
+            if n.id == 'ln':
+                n.id = 'log'
+            if n.id not in ALLOWED_NAMES:
+                raise ValueError(f"Use of name '{n.id}' is not allowed")
+        stack.extend(ast.iter_child_nodes(n))
+
+@functools.lru_cache(maxsize=256)
+def _compile_safe(expr: str):
     try:
-        node = ast.parse(expr, mode='eval')
+        node = ast.parse(expr, mode='eval', feature_version=(3, 11))
     except Exception as e:
         raise ValueError(f"Invalid expression: {e}")
 
-    for n in ast.walk(node):
-        if not isinstance(n, ALLOWED_NODES):
-            raise ValueError(f"Disallowed expression: {type(n).__name__}")
-        if isinstance(n, ast.Name) and n.id not in ALLOWED_NAMES:
-            raise ValueError(f"Use of name '{n.id}' is not allowed")
+    _validate(node)
+    return compile(node, '<safe>', 'eval')
+
+# direct-mapped front cache of compiled code; first sightings are only noted in
+# _SEEN, so a slot is written on an expression's second sighting and one-off
+# expressions (e.g. prefixes typed during live eval) never evict a hot entry
+_L1 = [(None, None)] * 64
+_SEEN = set()
 
-    compiled = compile(node, '<safe>', 'eval')
-    return eval(compiled, {'__builtins__': {}}, ALLOWED_NAMES)
+def safe_eval(expr: str):
+    expr = ' '.join(expr.translate(_EXPR_TRANS).replace('^', '**').split())
+    h = hash(expr) & 63
+    key, code = _L1[h]
+    if key != expr:
+        code = _compile_safe(expr)
+        if expr in _SEEN:
+            _SEEN.discard(expr)
+            _L1[h] = (expr, code)
+        else:
+            if len(_SEEN) >= 256: _SEEN.clear()
+            _SEEN.add(expr)
+    return eval(code, EVAL_GLOBALS)
+
+def is_number(val):
+    if isinstance(val,(tuple,list)): return all(isinstance(v,(int,float)) for v in val)
+    return isinstance(val,(int,float))
+
+def format_result(val):
+    return format(val,'.12g') if isinstance(val,float) else str(val)
+
+# --------------- number conversion -----------------
+_SPACE_TRANS = {ord(' '): None}
+_BASES = {'Binary':2,'Decimal':10,'Hexadecimal':16,'Octal':8}
+_FORMAT = {
+    'Binary': lambda v: format(v,'b'),
+    'Decimal': str,
+    'Hexadecimal': lambda v: format(v,'X'),
+    'Octal': lambda v: format(v,'o'),
+}
+
+def to_decimal(s,from_sys):
+    if from_sys not in _BASES: raise ValueError('Unknown input system')
+    return int(s,_BASES[from_sys])
+
+def from_decimal(val,to_sys):
+    if to_sys not in _FORMAT: raise ValueError('Unknown output system')
+    return _FORMAT[to_sys](val)
+
+@functools.lru_cache(maxsize=512)
+def _do_convert(s,from_sys,to_sys):
+    return from_decimal(to_decimal(s,from_sys),to_sys)
 
 # --------------- UI App -----------------
+class Theme(NamedTuple):
+    bg: str
+    panel: str
+    fg: str
+    btn_bg: str
+    accent: str
+
+THEME_STYLERS = {
+    'frame': lambda w,th: w.configure(bg=th.bg),
+    'label': lambda w,th: w.configure(bg=th.panel, fg=th.fg),
+    'button': lambda w,th: w.configure(bg=th.btn_bg, fg=th.fg, activebackground=th.accent),
+    'entry': lambda w,th: w.configure(bg=th.panel, fg=th.fg, insertbackground=th.fg),
+}
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -58,12 +164,13 @@ class App(tk.Tk):
         self.minsize(680, 400)
 
         self.themes = {
-            'light': {'bg':'#f3f4f6','panel':'#ffffff','fg':'#111827','btn_bg':'#e5e7eb','accent':'#2563eb'},
-            'dark': {'bg':'#0b1220','panel':'#0f1724','fg':'#e6eef8','btn_bg':'#1f2937','accent':'#60a5fa'}
+            'light': Theme(bg='#f3f4f6',panel='#ffffff',fg='#111827',btn_bg='#e5e7eb',accent='#2563eb'),
+            'dark': Theme(bg='#0b1220',panel='#0f1724',fg='#e6eef8',btn_bg='#1f2937',accent='#60a5fa')
         }
         self.current_theme = 'light'
+        self._themed = []
 
-        control = tk.Frame(self)
+        control = self.add_themed(tk.Frame(self), 'frame')
         control.pack(fill='x', padx=8, pady=8)
 
         self.mode_var = tk.StringVar(value='calculator')
@@ -73,14 +180,11 @@ class App(tk.Tk):
         self.theme_btn = ttk.Checkbutton(control, text='Dark Mode', command=self.toggle_theme, style='Toggle.TButton')
         self.theme_btn.pack(side='right')
 
-        self.container = tk.Frame(self)
+        self.container = self.add_themed(tk.Frame(self), 'frame')
         self.container.pack(fill='both', expand=True, padx=8, pady=(0,8))
 
+        self.frame_classes = {'CalculatorFrame': CalculatorFrame, 'ConverterFrame': ConverterFrame}
         self.frames = {}
-        for F in (CalculatorFrame, ConverterFrame):
-            frame = F(parent=self.container, controller=self)
-            frame.grid(row=0, column=0, sticky='nsew')
-            self.frames[F.__name__] = frame
 
         self.switch_mode()
         self.apply_theme()
@@ -89,62 +193,73 @@ class App(tk.Tk):
         self.show_frame('CalculatorFrame' if self.mode_var.get()=='calculator' else 'ConverterFrame')
 
     def show_frame(self, name):
+        if name not in self.frames:
+            start = len(self._themed)
+            frame = self.frame_classes[name](parent=self.container, controller=self)
+            frame.grid(row=0, column=0, sticky='nsew')
+            self.frames[name] = frame
+            th = self.themes[self.current_theme]
+            for w, role in self._themed[start:]: THEME_STYLERS[role](w, th)
         self.frames[name].tkraise()
 
     def toggle_theme(self):
         self.current_theme = 'dark' if self.current_theme=='light' else 'light'
-        self.apply_theme()
+        self.after_idle(self.apply_theme)
+
+    def add_themed(self, w, role):
+        self._themed.append((w, role))
+        return w
 
     def apply_theme(self):
         th = self.themes[self.current_theme]
-        self.configure(bg=th['bg'])
-        def style_widget(w):
-            cls = w.__class__.__name__
-            try:
-                if cls in ('Frame','LabelFrame'): w.configure(bg=th['bg'])
-                elif cls=='Label': w.configure(bg=th['panel'], fg=th['fg'])
-                elif cls=='Button': w.configure(bg=th['btn_bg'], fg=th['fg'], activebackground=th['accent'])
-                elif cls=='Entry': w.configure(bg=th['panel'], fg=th['fg'], insertbackground=th['fg'])
-                elif cls=='Text': w.configure(bg=th['panel'], fg=th['fg'], insertbackground=th['fg'])
-            except: pass
-            for child in w.winfo_children(): style_widget(child)
-        style_widget(self)
+        self.configure(bg=th.bg)
+        for w, role in self._themed: THEME_STYLERS[role](w, th)
+        self.update_idletasks()
 
 # --------------- Calculator Frame -----------------
+_BUTTONS = (
+    ('7',0,0), ('8',0,1), ('9',0,2), ('/',0,3), ('sqrt',0,4),
+    ('4',1,0), ('5',1,1), ('6',1,2), ('*',1,3), ('^',1,4),
+    ('1',2,0), ('2',2,1), ('3',2,2), ('-',2,3), ('(',2,4),
+    ('0',3,0), ('.',3,1), ('=',3,2), ('+',3,3), (')',3,4),
+    ('sin',4,0), ('cos',4,1), ('tan',4,2), ('log',4,3), ('ln',4,4),
+    ('pi',5,0), ('e',5,1), ('Ans',5,2), ('C',5,3), ('DEL',5,4),
+    ('factorial',6,0), ('exp',6,1), ('abs',6,2), ('round',6,3), ('%',6,4),
+)
+
 class CalculatorFrame(tk.Frame):
     def __init__(self,parent,controller):
         super().__init__(parent)
         self.controller = controller
-        left = tk.Frame(self)
+        themed = controller.add_themed
+        left = themed(tk.Frame(self), 'frame')
         left.pack(side='left', fill='both', expand=True, padx=(0,6))
 
         self.display_var = tk.StringVar()
         self.result_var = tk.StringVar()
-        disp_frame = tk.Frame(left)
+        self.last_answer = None
+        self._pending = None
+        self.display_var.trace_add('write', self._schedule_eval)
+        disp_frame = themed(tk.Frame(left), 'frame')
         disp_frame.pack(fill='x', padx=6, pady=6)
-        self.entry = tk.Entry(disp_frame,textvariable=self.display_var,font=('Consolas',18),justify='right')
+        self.entry = themed(tk.Entry(disp_frame,textvariable=self.display_var,font=('Consolas',18),justify='right'),'entry')
         self.entry.pack(fill='x',ipady=8)
         self.entry.bind('<Return>',lambda e:self.evaluate())
-        res_label = tk.Label(disp_frame,textvariable=self.result_var,anchor='e',font=('Consolas',12))
+        res_label = themed(tk.Label(disp_frame,textvariable=self.result_var,anchor='e',font=('Consolas',12)),'label')
         res_label.pack(fill='x')
 
-        btn_frame = tk.Frame(left)
+        btn_frame = themed(tk.Frame(left), 'frame')
         btn_frame.pack(fill='both',expand=True,padx=6,pady=6)
-        buttons = [
-            ['7','8','9','/','sqrt'],['4','5','6','*','^'],['1','2','3','-','('],['0','.','=','+',')'],
-            ['sin','cos','tan','log','ln'],['pi','e','Ans','C','DEL'],['factorial','exp','abs','round','%']
-        ]
-        for r,row in enumerate(buttons):
-            for c,label in enumerate(row):
-                b=tk.Button(btn_frame,text=label,command=lambda x=label:self.on_button(x),width=8,height=2)
-                b.grid(row=r,column=c,padx=4,pady=4,sticky='nsew')
-        for i in range(len(buttons[0])): btn_frame.grid_columnconfigure(i,weight=1)
+        for label,r,c in _BUTTONS:
+            b=themed(tk.Button(btn_frame,text=label,command=functools.partial(self.on_button,label),width=8,height=2),'button')
+            b.grid(row=r,column=c,padx=4,pady=4,sticky='nsew')
+        btn_frame.tk.call('grid','columnconfigure',btn_frame,'all','-weight',1)
 
     def on_button(self,label):
         if label=='C': self.clear()
         elif label=='DEL': self.backspace()
         elif label=='=': self.evaluate()
-        elif label=='Ans': self.insert_text(self.result_var.get())
+        elif label=='Ans': self.paste_answer()
         elif label=='sqrt': self.insert_text('sqrt(')
         elif label=='^': self.insert_text('**')
         elif label in ('pi','e'): self.insert_text(label)
@@ -153,79 +268,85 @@ class CalculatorFrame(tk.Frame):
         elif label in ('abs','round','log','ln','sin','cos','tan'): self.insert_text(label+'(')
         else: self.insert_text(label)
 
+    def paste_answer(self):
+        if self.last_answer is None: return
+        try: txt=repr(self.last_answer)
+        except ValueError: return
+        self.insert_text(txt)
+
     def insert_text(self,txt):
         cur=self.entry.index(tk.INSERT)
         self.entry.insert(cur,txt)
         self.entry.focus_set()
 
-    def clear(self): self.display_var.set(''); self.result_var.set('')
+    def clear(self): self.display_var.set(''); self.result_var.set(''); self.last_answer=None
     def backspace(self): s=self.display_var.get(); self.display_var.set(s[:-1])
 
     def evaluate(self):
         expr=self.display_var.get().strip()
         if not expr: return
         try:
-            expr=expr.replace('ln(','log(')
             val=safe_eval(expr)
-            if isinstance(val,float) and val.is_integer(): val=int(val)
-            self.result_var.set(str(val))
+            self.result_var.set(format_result(val))
+            # only stored once it formats: .12g rounding is for display, Ans keeps the raw value
+            self.last_answer=val
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror('Error',f'Could not evaluate expression:\n{e}')
 
+    def _schedule_eval(self,*args):
+        if self._pending: self.after_cancel(self._pending)
+        self._pending=self.after(50,self._live_eval)
+
+    def _live_eval(self):
+        # preview only: incomplete input is expected while typing, so errors just blank the result
+        self._pending=None
+        expr=self.display_var.get().strip()
+        if not expr: self.result_var.set(''); return
+        try:
+            val=safe_eval(expr)
+            self.result_var.set(format_result(val) if is_number(val) else '')
+        except Exception: self.result_var.set('')
+
 # --------------- Converter Frame -----------------
 class ConverterFrame(tk.Frame):
     def __init__(self,parent,controller):
         super().__init__(parent)
         self.controller=controller
-        container=tk.Frame(self)
+        themed=controller.add_themed
+        container=themed(tk.Frame(self),'frame')
         container.pack(fill='both',expand=True,padx=10,pady=10)
 
-        left=tk.Frame(container)
+        left=themed(tk.Frame(container),'frame')
         left.pack(side='left',fill='both',expand=True)
-        tk.Label(left,text='Number System Converter',font=('Helvetica',14,'bold')).pack(anchor='w')
-        tk.Label(left,text='Enter number:',anchor='w').pack(fill='x',pady=(8,0))
+        themed(tk.Label(left,text='Number System Converter',font=('Helvetica',14,'bold')),'label').pack(anchor='w')
+        themed(tk.Label(left,text='Enter number:',anchor='w'),'label').pack(fill='x',pady=(8,0))
 
         self.input_var=tk.StringVar()
         self.result_var=tk.StringVar()
         self.from_var=tk.StringVar(value='Binary')
         self.to_var=tk.StringVar(value='Decimal')
 
-        tk.Entry(left,textvariable=self.input_var,font=('Consolas',16)).pack(fill='x',pady=6)
+        themed(tk.Entry(left,textvariable=self.input_var,font=('Consolas',16)),'entry').pack(fill='x',pady=6)
         tk.OptionMenu(left,self.from_var,'Binary','Decimal','Hexadecimal','Octal').pack(fill='x',pady=4)
         tk.OptionMenu(left,self.to_var,'Binary','Decimal','Hexadecimal','Octal').pack(fill='x',pady=4)
 
-        btn_frame=tk.Frame(left); btn_frame.pack(fill='x',pady=6)
-        tk.Button(btn_frame,text='Convert',command=self.convert).pack(side='left',padx=4)
-        tk.Button(btn_frame,text='Clear',command=self.clear).pack(side='left',padx=4)
+        btn_frame=themed(tk.Frame(left),'frame'); btn_frame.pack(fill='x',pady=6)
+        themed(tk.Button(btn_frame,text='Convert',command=self.convert),'button').pack(side='left',padx=4)
+        themed(tk.Button(btn_frame,text='Clear',command=self.clear),'button').pack(side='left',padx=4)
 
-        tk.Label(left,text='Result:',anchor='w').pack(fill='x',pady=(8,0))
-        tk.Label(left,textvariable=self.result_var,font=('Consolas',16),anchor='w').pack(fill='x',pady=4)
+        themed(tk.Label(left,text='Result:',anchor='w'),'label').pack(fill='x',pady=(8,0))
+        themed(tk.Label(left,textvariable=self.result_var,font=('Consolas',16),anchor='w'),'label').pack(fill='x',pady=4)
 
     def convert(self):
-        s=self.input_var.get().strip().replace(' ','')
+        s=self.input_var.get().strip().translate(_SPACE_TRANS)
         try:
-            val=self.to_decimal(s,self.from_var.get())
-            res=self.from_decimal(val,self.to_var.get())
-            self.result_var.set(res)
+            self.result_var.set(_do_convert(s,self.from_var.get(),self.to_var.get()))
         except Exception as e:
             self.result_var.set(f'Error: {e}')
 
     def clear(self): self.input_var.set(''); self.result_var.set('')
 
-    def to_decimal(self,s,from_sys):
-        if from_sys=='Binary': return int(s,2)
-        elif from_sys=='Decimal': return int(s,10)
-        elif from_sys=='Hexadecimal': return int(s,16)
-        elif from_sys=='Octal': return int(s,8)
-        else: raise ValueError('Unknown input system')
-
-    def from_decimal(self,val,to_sys):
-        if to_sys=='Binary': return bin(val)[2:]
-        elif to_sys=='Decimal': return str(val)
-        elif to_sys=='Hexadecimal': return hex(val)[2:].upper()
-        elif to_sys=='Octal': return oct(val)[2:]
-        else: raise ValueError('Unknown output system')
-
 if __name__=='__main__':
     app=App()
     app.mainloop()